@@ -3,12 +3,17 @@
 from __future__ import annotations
 
 import sys
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
+from typing import TYPE_CHECKING
 
-from whispy.audio import Recorder, wait_for_key
 from whispy.config import WhispyConfig, parse_args
-from whispy.llm import OllamaLLM
-from whispy.stt import STT
-from whispy.tts import create_tts
+from whispy.tts import AsyncSpeaker, create_tts
+
+if TYPE_CHECKING:
+    from whispy.audio import KeyReader, Recorder
+    from whispy.llm import OllamaLLM
+    from whispy.stt import STT
 
 
 def print_banner(config: WhispyConfig) -> None:
@@ -23,24 +28,32 @@ def print_banner(config: WhispyConfig) -> None:
     print()
 
 
+# ANSI: erase the whole current line, then return to its start
+_ERASE_LINE = "\x1b[2K\r"
+
+
 def print_status(msg: str) -> None:
-    """Print a status message that overwrites itself."""
-    sys.stdout.write(f"\r  [{msg}]")
-    sys.stdout.flush()
+    """Print a status message that overwrites itself (terminals only)."""
+    if sys.stdout.isatty():
+        sys.stdout.write(f"{_ERASE_LINE}  [{msg}]")
+        sys.stdout.flush()
 
 
 def clear_status() -> None:
-    sys.stdout.write("\r" + " " * 60 + "\r")
-    sys.stdout.flush()
+    if sys.stdout.isatty():
+        sys.stdout.write(_ERASE_LINE)
+        sys.stdout.flush()
 
 
 def run(config: WhispyConfig) -> None:
     """Run the main conversation loop."""
-    # -- Initialize components -----------------------------------------------
-    print("Loading whisper model... ", end="", flush=True)
-    stt = STT(model_name=config.whisper_model)
-    print("ok")
+    # Imported here rather than at module level so that `whispy --help`
+    # doesn't pay for loading numpy, PortAudio, whisper.cpp and ollama.
+    from whispy.audio import KeyReader, Recorder
+    from whispy.llm import OllamaLLM
+    from whispy.stt import STT
 
+    # -- Initialize components -----------------------------------------------
     print("Connecting to Ollama... ", end="", flush=True)
     llm = OllamaLLM(
         model=config.llm_model,
@@ -49,11 +62,22 @@ def run(config: WhispyConfig) -> None:
     )
     print("ok")
 
+    # The LLM warms up in the background while whisper loads
+    print("Loading whisper model... ", end="", flush=True)
+    stt = STT(model_name=config.whisper_model, auto_downgrade=config.auto_downgrade)
+    if stt.model_name != config.whisper_model:
+        print(f"ok (no GPU found, using {stt.model_name})")
+        config = replace(config, whisper_model=stt.model_name)
+    else:
+        print("ok")
+
     tts = create_tts(
         backend=config.tts_backend,
         voice=config.resolved_tts_voice,
         rate=config.tts_rate,
     )
+    # Speech plays in the background so the next turn can start right away
+    speaker = AsyncSpeaker(tts)
 
     recorder = Recorder(sample_rate=config.sample_rate)
 
@@ -61,9 +85,52 @@ def run(config: WhispyConfig) -> None:
     print("Controls: SPACE = start/stop recording, Q = quit\n")
 
     # -- Conversation loop ---------------------------------------------------
+    try:
+        # One cbreak-mode session for the whole conversation
+        with KeyReader() as keys:
+            _conversation_loop(config, stt, llm, speaker, recorder, keys)
+    finally:
+        speaker.close()
+
+
+def _echo_reply(chunks: Iterable[str]) -> Iterator[str]:
+    """Print the reply as it streams in, passing the chunks through."""
+    first = True
+    for chunk in chunks:
+        if first:
+            clear_status()
+            sys.stdout.write("  Whispy: ")
+            first = False
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+        yield chunk
+
+
+def _finish_speaking(speaker: AsyncSpeaker) -> None:
+    """Report TTS errors from the previous reply.
+
+    It was interrupted when recording started, so this returns at once.
+    """
+    try:
+        speaker.wait()
+    except Exception as e:
+        print(f"  (TTS error: {e})")
+
+
+def _conversation_loop(
+    config: WhispyConfig,
+    stt: STT,
+    llm: OllamaLLM,
+    speaker: AsyncSpeaker,
+    recorder: Recorder,
+    keys: KeyReader,
+) -> None:
+    # Deferred like the imports in run(); whispy.llm is already loaded here
+    from whispy.llm import iter_sentences
+
     while True:
         print("  Ready. Press SPACE to talk.")
-        key = wait_for_key()
+        key = keys.read_key()
 
         if key in ("q", "Q"):
             print("\nGoodbye!")
@@ -73,12 +140,14 @@ def run(config: WhispyConfig) -> None:
             continue
 
         # --- Record ---------------------------------------------------------
+        # Silence the previous reply so the mic doesn't pick it up
+        speaker.interrupt()
         recorder.start()
         print_status("Recording... press SPACE when done")
 
-        while True:
-            k = wait_for_key()
-            if k == " ":
+        # Poll so the max-duration cut-off is noticed without a keypress
+        while not recorder.is_full:
+            if keys.read_key(timeout=0.25) == " ":
                 break
 
         audio = recorder.stop()
@@ -97,6 +166,9 @@ def run(config: WhispyConfig) -> None:
             for err in diag["stream_errors"]:
                 print(f"  (audio warning: {err})")
 
+        if diag["truncated"]:
+            print(f"  (recording stopped at the {recorder.max_seconds}s limit)")
+
         if diag["is_silent"]:
             print(
                 "  WARNING: Recording is silent (all zeros).\n"
@@ -125,28 +197,22 @@ def run(config: WhispyConfig) -> None:
 
         print(f"  You: {text}")
 
-        # --- LLM response ---------------------------------------------------
+        # --- LLM response, spoken sentence by sentence as it streams -------
+        _finish_speaking(speaker)
         print_status("Thinking...")
+        replied = False
         try:
-            response = llm.chat(text)
+            for sentence in iter_sentences(_echo_reply(llm.chat_stream(text))):
+                speaker.speak(sentence)
+                replied = True
         except RuntimeError as e:
             clear_status()
             print(f"  Error: {e}\n")
             continue
-        clear_status()
-
-        print(f"  Whispy: {response}\n")
-
-        # --- Speak ----------------------------------------------------------
-        print_status("Speaking...")
-        try:
-            tts.speak(response)
-        except Exception as e:
-            clear_status()
-            print(f"  (TTS error: {e})")
-        clear_status()
+        if not replied:
+            clear_status()  # nothing was echoed over "Thinking..."
 
-        print()  # blank line between turns
+        print("\n")
 
 
 def main() -> None:
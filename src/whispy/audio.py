@@ -8,42 +8,65 @@ from __future__ import annotations
 
 import io
 import sys
-import wave
+from types import ModuleType
+from typing import TYPE_CHECKING
 
 import numpy as np
 
-try:
+if TYPE_CHECKING:
     import sounddevice as sd
-except ImportError:
-    sd = None
 
 
-def _require_sounddevice() -> None:
-    if sd is None:
+def _require_sounddevice() -> ModuleType:
+    """Import sounddevice on first use; loading PortAudio is slow."""
+    try:
+        import sounddevice
+    except ImportError as e:
         raise RuntimeError(
             "sounddevice is not installed. Install it with:\n"
             "  uv pip install sounddevice\n"
             "On macOS you may also need: brew install portaudio"
-        )
+        ) from e
+    return sounddevice
 
 
 class Recorder:
     """Record audio from the microphone."""
 
-    def __init__(self, sample_rate: int = 16000) -> None:
-        _require_sounddevice()
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        max_seconds: int = 600,
+        latency: str | float = "low",
+    ) -> None:
+        self._sd = _require_sounddevice()
         self.sample_rate = sample_rate
-        self._frames: list[np.ndarray] = []
+        self.max_seconds = max_seconds
+        # "low" trims the start-of-utterance delay; PortAudio's default is
+        # tuned for glitch-free playback, not interactive capture.
+        self.latency = latency
+        # Preallocated so the audio callback never allocates; np.empty only
+        # commits the pages that actually get written.
+        self._buf = np.empty(sample_rate * max_seconds, dtype=np.float32)
+        self._write = 0
         self._stream: sd.InputStream | None = None
 
+    @property
+    def is_full(self) -> bool:
+        """True once max_seconds of audio have been captured."""
+        return self._write >= self._buf.size
+
     def start(self) -> None:
         """Start recording from the default microphone."""
-        self._frames = []
-        self._status_errors: list[str] = []
-        self._stream = sd.InputStream(
+        self._write = 0
+        self._error_count = 0
+        self._last_status: sd.CallbackFlags | None = None
+        self._stream = self._sd.InputStream(
             samplerate=self.sample_rate,
             channels=1,
             dtype="float32",
+            blocksize=0,  # let the driver pick the optimal block size
+            latency=self.latency,
             callback=self._callback,
         )
         self._stream.start()
@@ -55,9 +78,16 @@ class Recorder:
         time_info: object,
         status: sd.CallbackFlags,
     ) -> None:
+        # Runs on the PortAudio thread: no allocations, just record the flags
         if status:
-            self._status_errors.append(str(status))
-        self._frames.append(indata.copy())
+            self._error_count += 1
+            self._last_status = status
+        start = self._write
+        end = min(start + frames, self._buf.size)
+        self._buf[start:end] = indata[: end - start, 0]
+        self._write = end
+        if end == self._buf.size:
+            raise self._sd.CallbackStop  # buffer full: stop capturing, keep audio
 
     def stop(self) -> np.ndarray:
         """Stop recording and return audio as a float32 numpy array."""
@@ -65,10 +95,7 @@ class Recorder:
             self._stream.stop()
             self._stream.close()
             self._stream = None
-        if self._frames:
-            audio = np.concatenate(self._frames, axis=0).flatten()
-            return audio
-        return np.array([], dtype=np.float32)
+        return self._buf[: self._write].copy()
 
     def get_diagnostics(self, audio: np.ndarray, sample_rate: int) -> dict:
         """Return recording diagnostics for debugging."""
@@ -78,58 +105,87 @@ class Recorder:
             "duration_s": round(duration, 1),
             "peak_amplitude": round(peak, 4),
             "is_silent": peak < 0.001,
-            "stream_errors": list(self._status_errors),
+            "stream_errors": (
+                [f"{self._error_count} stream errors; last={self._last_status}"]
+                if self._error_count
+                else []
+            ),
+            "truncated": self.is_full,
         }
 
 
 def play_audio(audio: np.ndarray, sample_rate: int) -> None:
     """Play a numpy audio array through the default speaker."""
-    _require_sounddevice()
+    sd = _require_sounddevice()
     sd.play(audio, samplerate=sample_rate)
     sd.wait()
 
 
 def audio_to_wav_bytes(audio: np.ndarray, sample_rate: int) -> bytes:
-    """Convert a float32 numpy array to WAV file bytes."""
-    audio_int16 = (audio * 32767).astype(np.int16)
+    """Convert a float32 numpy array to 16-bit WAV file bytes.
+
+    Samples outside [-1, 1] are clipped rather than wrapped around.
+    """
+    import soundfile as sf
+
     buf = io.BytesIO()
-    with wave.open(buf, "wb") as wf:
-        wf.setnchannels(1)
-        wf.setsampwidth(2)
-        wf.setframerate(sample_rate)
-        wf.writeframes(audio_int16.tobytes())
+    sf.write(buf, audio, sample_rate, format="WAV", subtype="PCM_16")
     return buf.getvalue()
 
 
 def wav_bytes_to_audio(wav_data: bytes) -> tuple[np.ndarray, int]:
     """Convert WAV bytes to a float32 numpy array and sample rate."""
-    buf = io.BytesIO(wav_data)
-    with wave.open(buf, "rb") as wf:
-        sample_rate = wf.getframerate()
-        audio_bytes = wf.readframes(wf.getnframes())
-        audio_int16 = np.frombuffer(audio_bytes, dtype=np.int16)
-        audio_float32 = audio_int16.astype(np.float32) / 32767
-    return audio_float32, sample_rate
+    import soundfile as sf
+
+    audio, sample_rate = sf.read(io.BytesIO(wav_data), dtype="float32")
+    return audio, sample_rate
 
 
 # -- Terminal key reading (for push-to-talk) --------------------------------
 
 if sys.platform in ("darwin", "linux"):
+    import os
+    import select
     import termios
     import tty
 
-    def wait_for_key() -> str:
-        """Block until a single key is pressed. Returns the character."""
-        fd = sys.stdin.fileno()
-        old = termios.tcgetattr(fd)
-        try:
-            tty.setcbreak(fd)  # cbreak: single-char read, Ctrl+C still works
-            return sys.stdin.read(1)
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old)
+    class KeyReader:
+        """Read single keypresses from the terminal.
+
+        Use as a context manager around the whole session: the terminal is
+        switched to cbreak mode once on entry and restored on exit, rather
+        than on every key.
+        """
+
+        def __enter__(self) -> KeyReader:
+            self._fd = sys.stdin.fileno()
+            self._old = termios.tcgetattr(self._fd)
+            tty.setcbreak(self._fd)  # cbreak: single-char read, Ctrl+C still works
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            termios.tcsetattr(self._fd, termios.TCSADRAIN, self._old)
+
+        def read_key(self, timeout: float | None = None) -> str | None:
+            """Block until a key is pressed and return it.
+
+            Returns None if no key was pressed within `timeout` seconds.
+            """
+            ready, _, _ = select.select([self._fd], [], [], timeout)
+            if not ready:
+                return None
+            return os.read(self._fd, 1).decode(errors="ignore")
 
 else:
-    def wait_for_key() -> str:
-        """Fallback: wait for Enter key."""
-        input()
-        return "\n"
+    class KeyReader:
+        """Fallback: wait for the Enter key."""
+
+        def __enter__(self) -> KeyReader:
+            return self
+
+        def __exit__(self, *exc_info: object) -> None:
+            pass
+
+        def read_key(self, timeout: float | None = None) -> str | None:
+            input()
+            return "\n"
@@ -3,8 +3,9 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import sys
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 
 if sys.version_info >= (3, 11):
@@ -49,12 +50,17 @@ MACOS_VOICES = {
 }
 
 
-@dataclass
+@dataclass(frozen=True)
 class WhispyConfig:
-    """Runtime configuration."""
+    """Runtime configuration.
+
+    Frozen (and therefore hashable); use dataclasses.replace() to derive
+    a modified copy.
+    """
 
     language: str = "en"
     whisper_model: str = "small"
+    auto_downgrade: bool = True  # use a smaller whisper model when no GPU is found
     llm_model: str = "qwen3:8b"
     tts_backend: str = "say"  # "say" (macOS built-in) or "piper"
     tts_voice: str = ""  # auto-selected from language if empty
@@ -62,41 +68,62 @@ class WhispyConfig:
     sample_rate: int = 16000  # audio sample rate (whisper expects 16kHz)
     max_history: int = 20  # max conversation messages kept in memory
 
-    @property
-    def system_prompt(self) -> str:
-        return SYSTEM_PROMPTS.get(self.language, SYSTEM_PROMPTS["en"])
+    # Derived from the fields above in __post_init__
+    system_prompt: str = field(init=False, repr=False)
+    resolved_tts_voice: str = field(init=False)
 
-    @property
-    def resolved_tts_voice(self) -> str:
-        if self.tts_voice:
-            return self.tts_voice
-        return MACOS_VOICES.get(self.language, MACOS_VOICES["en"])
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self,
+            "system_prompt",
+            SYSTEM_PROMPTS.get(self.language, SYSTEM_PROMPTS["en"]),
+        )
+        object.__setattr__(
+            self,
+            "resolved_tts_voice",
+            self.tts_voice or MACOS_VOICES.get(self.language, MACOS_VOICES["en"]),
+        )
 
 
 def load_config(config_path: Path | None = None) -> WhispyConfig:
     """Load configuration from a TOML file, if it exists."""
-    config = WhispyConfig()
-    if config_path and config_path.exists():
-        with open(config_path, "rb") as f:
+    if config_path is None:
+        return WhispyConfig()
+    try:
+        mtime = config_path.stat().st_mtime_ns
+    except OSError:  # missing or unreadable: use the defaults
+        return WhispyConfig()
+    # Keyed on mtime so an edited file is re-read
+    return _load_config_cached(str(config_path), mtime)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime: int) -> WhispyConfig:
+    # Configs are frozen, so handing out the same cached instance is safe
+    try:
+        with open(path, "rb") as f:
             data = tomllib.load(f)
-        whispy = data.get("whispy", {})
-        for key in (
-            "language",
-            "whisper_model",
-            "llm_model",
-            "tts_backend",
-            "tts_voice",
-            "tts_rate",
-            "sample_rate",
-            "max_history",
-        ):
-            if key in whispy:
-                setattr(config, key, whispy[key])
-    return config
-
-
-def parse_args(argv: list[str] | None = None) -> WhispyConfig:
-    """Parse CLI arguments and merge with config file."""
+    except FileNotFoundError:  # removed since the stat
+        return WhispyConfig()
+    whispy = data.get("whispy", {})
+    overrides = {}
+    for key in (
+        "language",
+        "whisper_model",
+        "auto_downgrade",
+        "llm_model",
+        "tts_backend",
+        "tts_voice",
+        "tts_rate",
+        "sample_rate",
+        "max_history",
+    ):
+        if key in whispy:
+            overrides[key] = whispy[key]
+    return WhispyConfig(**overrides)
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="whispy",
         description="Whispy — Voice AI assistant for kids",
@@ -128,21 +155,30 @@ def parse_args(argv: list[str] | None = None) -> WhispyConfig:
         default=None,
         help="path to config.toml file",
     )
+    return parser
 
-    args = parser.parse_args(argv)
 
-    # Load base config from file
+# Built once; parse_args() can be called repeatedly (e.g. from tests)
+_PARSER = _build_parser()
+
+
+def parse_args(argv: list[str] | None = None) -> WhispyConfig:
+    """Parse CLI arguments and merge with config file."""
+    args = _PARSER.parse_args(argv)
+
+    # Load base config from file (defaults if it doesn't exist)
     config_path = Path(args.config) if args.config else Path("config.toml")
-    config = load_config(config_path if config_path.exists() else None)
+    config = load_config(config_path)
 
     # CLI overrides
+    overrides = {}
     if args.language is not None:
-        config.language = args.language
+        overrides["language"] = args.language
     if args.model is not None:
-        config.llm_model = args.model
+        overrides["llm_model"] = args.model
     if args.whisper_model is not None:
-        config.whisper_model = args.whisper_model
+        overrides["whisper_model"] = args.whisper_model
     if args.tts is not None:
-        config.tts_backend = args.tts
+        overrides["tts_backend"] = args.tts
 
-    return config
+    return replace(config, **overrides)
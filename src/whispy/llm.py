@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import re
+import threading
+from collections import deque
+from collections.abc import Iterable, Iterator
 from typing import Protocol
 
 try:
@@ -13,11 +17,13 @@ except ImportError:
 class LLMBackend(Protocol):
     """Interface for LLM backends.
 
-    Any backend that implements chat() and reset() can be used.
+    Any backend that implements chat(), chat_stream() and reset() can be
+    used.
     This makes it easy to add OpenAI-compatible APIs later.
     """
 
     def chat(self, message: str) -> str: ...
+    def chat_stream(self, message: str) -> Iterator[str]: ...
     def reset(self) -> None: ...
 
 
@@ -29,6 +35,7 @@ class OllamaLLM:
         model: str = "qwen3:8b",
         system_prompt: str = "",
         max_history: int = 20,
+        keep_alive: str = "30m",
     ) -> None:
         if ollama_client is None:
             raise RuntimeError(
@@ -39,51 +46,155 @@ class OllamaLLM:
         self.model = model
         self.system_prompt = system_prompt
         self.max_history = max_history
-        self._history: list[dict[str, str]] = []
-        if system_prompt:
-            self._history.append({"role": "system", "content": system_prompt})
+        self.keep_alive = keep_alive
+        # The system prompt is kept apart from the turns so it can never be
+        # trimmed. Turns are stored as parallel role/content deques (no dict
+        # per message until request time); both drop their oldest entry on
+        # append, so they stay aligned.
+        self._system: dict[str, str] | None = (
+            {"role": "system", "content": system_prompt} if system_prompt else None
+        )
+        max_turns = max(max_history - 1 if self._system else max_history, 1)
+        self._roles: deque[str] = deque(maxlen=max_turns)
+        self._contents: deque[str] = deque(maxlen=max_turns)
+
+        # Load the model into memory in the background so the first reply
+        # doesn't pay the (often many seconds) cold-load cost.
+        self._warm_up_thread: threading.Thread | None = threading.Thread(
+            target=self._warm_up, name="whispy-ollama-warm-up", daemon=True
+        )
+        self._warm_up_thread.start()
+
+    def _warm_up(self) -> None:
+        try:
+            # A generate request without a prompt only loads the model
+            ollama_client.generate(model=self.model, keep_alive=self.keep_alive)
+        except Exception:
+            # Not fatal: the first real request loads the model instead, and
+            # reports any connection problem itself.
+            pass
+
+    def _wait_for_warm_up(self) -> None:
+        if self._warm_up_thread is not None:
+            self._warm_up_thread.join()
+            self._warm_up_thread = None
+
+    @property
+    def history(self) -> list[dict[str, str]]:
+        """The conversation messages as sent to the model."""
+        messages = [self._system] if self._system else []
+        messages.extend(
+            {"role": role, "content": content}
+            for role, content in zip(self._roles, self._contents)
+        )
+        return messages
 
     def chat(self, message: str) -> str:
         """Send a message and get a response. Maintains conversation history."""
-        self._history.append({"role": "user", "content": message})
-        self._trim_history()
+        self._wait_for_warm_up()
+        self._append("user", message)
 
         try:
             response = ollama_client.chat(
                 model=self.model,
-                messages=self._history,
+                messages=self.history,
+                keep_alive=self.keep_alive,
             )
         except Exception as e:
             # Remove the user message if the request failed
-            self._history.pop()
-            error_msg = str(e)
-            if "connection" in error_msg.lower():
-                raise RuntimeError(
-                    "Cannot connect to Ollama. Is it running?\n"
-                    "  Start it with: ollama serve"
-                ) from e
+            self._roles.pop()
+            self._contents.pop()
+            _raise_for_connection(e)
             raise
 
         reply = response["message"]["content"]
-        self._history.append({"role": "assistant", "content": reply})
-        self._trim_history()
+        self._append("assistant", reply)
         return reply
 
+    def chat_stream(self, message: str) -> Iterator[str]:
+        """Send a message and yield the response as it is generated.
+
+        The full reply is added to the conversation history once the
+        stream is complete.
+        """
+        self._wait_for_warm_up()
+        self._append("user", message)
+
+        parts: list[str] = []
+        try:
+            stream = ollama_client.chat(
+                model=self.model,
+                messages=self.history,
+                stream=True,
+                keep_alive=self.keep_alive,
+            )
+            for chunk in stream:
+                content = chunk["message"]["content"]
+                if content:
+                    parts.append(content)
+                    yield content
+        except Exception as e:
+            # Remove the user message if the request failed
+            self._roles.pop()
+            self._contents.pop()
+            _raise_for_connection(e)
+            raise
+
+        self._append("assistant", "".join(parts))
+
     def reset(self) -> None:
         """Clear conversation history (keeps system prompt)."""
-        self._history = []
-        if self.system_prompt:
-            self._history.append({"role": "system", "content": self.system_prompt})
-
-    def _trim_history(self) -> None:
-        """Keep history within max_history limit, preserving system prompt."""
-        if len(self._history) <= self.max_history:
-            return
-        has_system = (
-            self._history and self._history[0]["role"] == "system"
-        )
-        if has_system:
-            system = self._history[0]
-            self._history = [system] + self._history[-(self.max_history - 1) :]
-        else:
-            self._history = self._history[-self.max_history :]
+        self._roles.clear()
+        self._contents.clear()
+
+    def _append(self, role: str, content: str) -> None:
+        self._roles.append(role)
+        self._contents.append(content)
+
+
+def _raise_for_connection(error: Exception) -> None:
+    """Turn an Ollama connection failure into a friendly RuntimeError."""
+    if "connection" in str(error).lower():
+        raise RuntimeError(
+            "Cannot connect to Ollama. Is it running?\n"
+            "  Start it with: ollama serve"
+        ) from error
+
+
+# A sentence ends at terminal punctuation followed by whitespace, or at a
+# line break (list items, paragraphs).
+_SENTENCE_END_RE = re.compile(r"[.!?](?=\s)|\n")
+# "1." on its own is the start of a numbered list item, not a sentence
+_LIST_NUMBER_RE = re.compile(r"\s*\d+\.")
+# Nor does a sentence end at the period of an abbreviation: dotted letters
+# ("e.g.", "i.e.", "U.S.") or a title before a name ("Dr.", "Mme.")
+_ABBREVIATION_END_RE = re.compile(
+    r"(?:(?:\b[A-Za-z]\.){2,}"
+    r"|\b(?:Mr|Mrs|Ms|Dr|Prof|St|Mme|Mlle|vs|cf|approx)\.)\Z",
+    re.IGNORECASE,
+)
+
+
+def iter_sentences(chunks: Iterable[str]) -> Iterator[str]:
+    """Regroup streamed text chunks into complete sentences.
+
+    Lets TTS start speaking the first sentence while the rest of the
+    reply is still being generated.
+    """
+    buffer = ""
+    for chunk in chunks:
+        buffer += chunk
+        start = 0
+        for match in _SENTENCE_END_RE.finditer(buffer):
+            sentence = buffer[start : match.end()]
+            if _LIST_NUMBER_RE.fullmatch(sentence):
+                continue
+            if match.group() == "." and _ABBREVIATION_END_RE.search(sentence):
+                continue
+            if sentence.strip():
+                yield sentence.strip()
+            start = match.end()
+        buffer = buffer[start:]
+    if buffer.strip():
+        yield buffer.strip()
+
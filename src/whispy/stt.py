@@ -2,16 +2,37 @@
 
 from __future__ import annotations
 
-import tempfile
-import wave
-from pathlib import Path
+import re
+from bisect import bisect_right
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
 
 import numpy as np
 
-try:
-    from pywhispercpp.model import Model as WhisperModel
-except ImportError:
-    WhisperModel = None
+if TYPE_CHECKING:
+    from pywhispercpp.model import Segment
+
+WHISPER_SAMPLE_RATE = 16000
+# whisper.cpp encodes audio in fixed 30 s windows
+WHISPER_WINDOW_S = 30
+# Silence inserted between clips packed into the same window
+BATCH_GAP_S = 1.0
+
+# whisper.cpp params giving one segment per word, with token-level
+# timestamps, so text decoded from packed clips can be split between them.
+# pywhispercpp keeps params from one call to the next, so other calls pass
+# the defaults explicitly.
+_WORD_SEGMENTS = {"token_timestamps": True, "max_len": 1, "split_on_word": True}
+_DEFAULT_SEGMENTS = {"token_timestamps": False, "max_len": 0, "split_on_word": False}
+
+# Model families too slow for interactive use without a GPU
+_CPU_HEAVY_MODELS = ("small", "medium", "large")
+# A GPU backend in whisper.cpp's system info: "METAL = 1" in older builds,
+# a "Metal : ..." section in newer ones.
+_ACCELERATOR_RE = re.compile(
+    r"\b(?:METAL|CUDA|VULKAN|HIP|SYCL|OPENCL|COREML)\b\s*(?:=\s*1|:)",
+    re.IGNORECASE,
+)
 
 
 class STT:
@@ -21,13 +42,19 @@ class STT:
     Models are downloaded automatically on first use.
     """
 
-    def __init__(self, model_name: str = "small") -> None:
-        if WhisperModel is None:
+    def __init__(self, model_name: str = "small", auto_downgrade: bool = True) -> None:
+        # Imported here: loading the native whisper.cpp library is slow
+        try:
+            from pywhispercpp.model import Model as WhisperModel
+        except ImportError as e:
             raise RuntimeError(
                 "pywhispercpp is not installed. Install it with:\n"
                 "  uv pip install pywhispercpp\n"
                 "You may also need: brew install cmake"
-            )
+            ) from e
+        if auto_downgrade and not _has_accelerator(WhisperModel.system_info()):
+            model_name = _cpu_model_for(model_name)
+        self.model_name = model_name
         self.model = WhisperModel(model_name)
 
     def transcribe(
@@ -49,23 +76,159 @@ class STT:
         if audio.size == 0:
             return ""
 
-        # pywhispercpp works best with file paths — write a temp WAV file
-        wav_path = self._save_temp_wav(audio, sample_rate)
-        try:
-            segments = self.model.transcribe(wav_path, language=language)
-            text = " ".join(seg.text for seg in segments).strip()
-            return text
-        finally:
-            Path(wav_path).unlink(missing_ok=True)
-
-    @staticmethod
-    def _save_temp_wav(audio: np.ndarray, sample_rate: int) -> str:
-        """Save audio to a temporary WAV file and return the path."""
-        tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        audio_int16 = (audio.flatten() * 32767).astype(np.int16)
-        with wave.open(tmp.name, "wb") as wf:
-            wf.setnchannels(1)
-            wf.setsampwidth(2)
-            wf.setframerate(sample_rate)
-            wf.writeframes(audio_int16.tobytes())
-        return tmp.name
+        audio = _prepare(audio, sample_rate)
+        segments = self.model.transcribe(
+            audio, language=language, **_DEFAULT_SEGMENTS
+        )
+        text = " ".join(seg.text for seg in segments).strip()
+        return text
+
+    def transcribe_batch(
+        self,
+        audios: list[np.ndarray],
+        sample_rate: int = 16000,
+        language: str = "en",
+    ) -> list[str]:
+        """Transcribe several utterances with as few whisper.cpp calls as possible.
+
+        whisper.cpp pads every call to a full 30 s window, so short clips are
+        packed together, separated by silence, and each window is decoded
+        once. Words are mapped back to their clip by timestamp.
+
+        Args:
+            audios: Float32 numpy arrays of audio samples (mono).
+            sample_rate: Sample rate of the audio (should be 16000).
+            language: Language code for transcription ('en', 'fr', etc.).
+
+        Returns:
+            One transcribed text string per input, in input order.
+        """
+        clips = [
+            _prepare(audio, sample_rate) if audio.size else None for audio in audios
+        ]
+        texts = [""] * len(clips)
+        sizes = {i: clip.size for i, clip in enumerate(clips) if clip is not None}
+        gap = int(BATCH_GAP_S * WHISPER_SAMPLE_RATE)
+        capacity = WHISPER_WINDOW_S * WHISPER_SAMPLE_RATE
+
+        for window in _pack_windows(sizes, capacity, gap):
+            if len(window) == 1:
+                (i,) = window
+                segments = self.model.transcribe(
+                    clips[i], language=language, **_DEFAULT_SEGMENTS
+                )
+                texts[i] = " ".join(seg.text for seg in segments).strip()
+                continue
+
+            silence = np.zeros(gap, dtype=np.float32)
+            parts: list[np.ndarray] = []
+            bounds: list[tuple[int, int]] = []
+            offset = 0
+            for i in window:
+                if parts:
+                    parts.append(silence)
+                    offset += gap
+                bounds.append((offset, offset + clips[i].size))
+                parts.append(clips[i])
+                offset += clips[i].size
+
+            segments = self.model.transcribe(
+                np.concatenate(parts), language=language, **_WORD_SEGMENTS
+            )
+            for i, text in zip(window, _split_by_clip(segments, bounds)):
+                texts[i] = text
+        return texts
+
+
+def _has_accelerator(system_info: str) -> bool:
+    """Whether whisper.cpp's system info string lists a GPU backend."""
+    return _ACCELERATOR_RE.search(system_info) is not None
+
+
+def _cpu_model_for(model_name: str) -> str:
+    """Return the model to use instead of model_name on a CPU-only machine.
+
+    small/medium/large take seconds per utterance on a CPU, so they are
+    swapped for base (keeping English-only variants English-only).
+    """
+    if not model_name.startswith(_CPU_HEAVY_MODELS):
+        return model_name
+    return "base.en" if ".en" in model_name else "base"
+
+
+def _prepare(audio: np.ndarray, sample_rate: int) -> np.ndarray:
+    """Return audio as whisper.cpp wants it: contiguous float32 mono at 16 kHz.
+
+    Samples are handed straight to whisper.cpp, no WAV file round-trip.
+    """
+    audio = np.ascontiguousarray(audio.reshape(-1), dtype=np.float32)
+    if sample_rate != WHISPER_SAMPLE_RATE:
+        audio = _resample(audio, sample_rate, WHISPER_SAMPLE_RATE)
+    return audio
+
+
+def _pack_windows(sizes: dict[int, int], capacity: int, gap: int) -> list[list[int]]:
+    """Group clip indices into windows of at most `capacity` samples.
+
+    Longest clips are placed first (first-fit decreasing), which keeps
+    similar lengths together and wastes little padding. Clips longer
+    than a window get one of their own.
+    """
+    windows: list[list[int]] = []
+    used: list[int] = []
+    for i in sorted(sizes, key=sizes.__getitem__, reverse=True):
+        for w, window in enumerate(windows):
+            if used[w] + gap + sizes[i] <= capacity:
+                window.append(i)
+                used[w] += gap + sizes[i]
+                break
+        else:
+            windows.append([i])
+            used.append(sizes[i])
+    return windows
+
+
+def _split_by_clip(
+    segments: Iterable[Segment], bounds: list[tuple[int, int]]
+) -> list[str]:
+    """Split the text of segments decoded from packed clips back into clips.
+
+    bounds holds each clip's (start, end) sample range in the packed audio.
+    A segment's words are spread evenly over the speech it overlaps, so one
+    spanning the silence between two clips is split between them instead
+    of being given whole to either.
+    """
+    words_per_clip: list[list[str]] = [[] for _ in bounds]
+    starts = [start for start, _ in bounds]
+    for seg in segments:
+        words = seg.text.split()
+        if not words:
+            continue
+        # Segment times are in 10 ms units
+        t0 = seg.t0 * WHISPER_SAMPLE_RATE // 100
+        t1 = seg.t1 * WHISPER_SAMPLE_RATE // 100
+        overlaps = [max(min(t1, end) - max(t0, start), 0) for start, end in bounds]
+        total = sum(overlaps)
+        if not total:
+            # Falls entirely in a gap: give it to the clip before
+            clip = max(bisect_right(starts, (t0 + t1) // 2) - 1, 0)
+            words_per_clip[clip].extend(words)
+            continue
+        clip = 0
+        covered = overlaps[0]
+        for k, word in enumerate(words):
+            # Where the middle of the word falls within the speech covered
+            position = (k + 0.5) * total / len(words)
+            while position > covered:
+                clip += 1
+                covered += overlaps[clip]
+            words_per_clip[clip].append(word)
+    return [" ".join(words) for words in words_per_clip]
+
+
+def _resample(audio: np.ndarray, src_rate: int, dst_rate: int) -> np.ndarray:
+    """Linearly resample a mono float32 array."""
+    n_out = round(audio.size * dst_rate / src_rate)
+    src_times = np.arange(audio.size) / src_rate
+    dst_times = np.arange(n_out) / dst_rate
+    return np.interp(dst_times, src_times, audio).astype(np.float32)
@@ -10,39 +10,175 @@ from __future__ import annotations
 import re
 import subprocess
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from typing import Protocol
 
-# Matches emoji characters that TTS engines try to read aloud
-_EMOJI_RE = re.compile(
-    "["
-    "\U0001F600-\U0001F64F"  # emoticons
-    "\U0001F300-\U0001F5FF"  # symbols & pictographs
-    "\U0001F680-\U0001F6FF"  # transport & map symbols
-    "\U0001F900-\U0001F9FF"  # supplemental symbols
-    "\U0001FA00-\U0001FA6F"  # chess symbols, extended-A
-    "\U0001FA70-\U0001FAFF"  # symbols extended-A
-    "\U00002702-\U000027B0"  # dingbats
-    "\U0001F1E0-\U0001F1FF"  # flags
-    "\u200d"                  # zero-width joiner
-    "\ufe0f"                  # variation selector-16
-    "\u2600-\u26FF"           # misc symbols (sun, stars, etc.)
-    "\u2700-\u27BF"           # dingbats
-    "]+",
-    flags=re.UNICODE,
+# Emoji code point ranges (inclusive) that TTS engines try to read aloud.
+# Whole blocks, so newer emojis added to them (e.g. coloured circles) are
+# covered too.
+_EMOJI_RANGES = (
+    (0x1F1E0, 0x1F1FF),  # regional indicators (flags)
+    (0x1F300, 0x1FAFF),  # pictographs, emoticons, transport, supplemental, ...
+    (0x2600, 0x27BF),  # misc symbols (sun, stars, etc.) and dingbats
+    (0x2B00, 0x2BFF),  # misc symbols and arrows (star, circles, squares)
+    (0x200D, 0x200D),  # zero-width joiner
+    (0xFE0F, 0xFE0F),  # variation selector-16
 )
 
+# str.translate() table deleting every emoji code point
+_EMOJI_TRANSLATE = dict.fromkeys(
+    chain.from_iterable(range(first, last + 1) for first, last in _EMOJI_RANGES)
+)
+# Text entirely below this code point has no emojis to delete
+_EMOJI_MIN = chr(min(first for first, _ in _EMOJI_RANGES))
+
+# Markdown that LLMs like to produce and TTS would read out. Line-start
+# alternatives come first so a "* " bullet isn't taken for italics.
+# Emphasis needs a non-space inside its delimiters and no word character
+# ("*") or digit ("**") outside them, so "2*3=6" and "2**3" are left alone.
+_RE_MARKDOWN = re.compile(
+    r"^#{1,6}[ \t]*"  # header
+    r"|^[ \t]*(?:\d{1,2}\.|[-*])[ \t]+"  # list marker, not a year ("2024.")
+    r"|(?<![\d*])\*\*(?P<bold>[^*\s](?:[^*\n]|\*(?!\*))*+(?<!\s))"
+    r"\*\*(?![\d*])"
+    r"|(?<![\w*])\*(?P<italic>[^*\s][^*\n]*+(?<!\s))\*(?![\w*])",
+    re.MULTILINE,
+)
+# Keeps the bold/italic text; headers and list markers expand to ""
+_MARKDOWN_REPL = r"\g<bold>\g<italic>"
+# Lines (e.g. list items) not ending in one of these get a period, so TTS
+# pauses before the next line
+_LINE_TERMINATORS = frozenset(".!?:")
+# Markup left after the patterns above: inline code, strikethrough, tables
+_STRAY_CHARS = "`~|"
+_STRAY_MARKUP = str.maketrans("", "", _STRAY_CHARS)
+_STRAY_CHAR_SET = frozenset(_STRAY_CHARS)
+# Leftover "*", "_" and "#" (unpaired emphasis, closing header hashes),
+# except where they are part of a word or expression. Matched from the
+# start of a run, so a kept run isn't deleted from its middle.
+_RE_STRAY_SYMBOLS = re.compile(
+    # "*" except as an operator: "7*8", "3 * 4", "(2+3)*4", "2**3"
+    r"(?<!\*)(?!(?<=[\w)])\*+[\w(]|(?<=[\w)] )\*+ [\w(])\*++"
+    # "_" except inside a word: snake_case, 1_000
+    r"|(?<!_)(?!(?<=[^\W_])_+[^\W_])_++"
+    # "#" except in names and numbers: C#, F#, #1
+    r"|(?<![\w#])#++(?!\d)"
+)
+_STRAY_SYMBOL_SET = frozenset("*_#")
+# Anything in here means the text may need more than whitespace cleanup
+_MARKUP_CHARS = _STRAY_CHAR_SET | _STRAY_SYMBOL_SET | {"\n"}
+
+
+def _is_plain(text: str) -> bool:
+    """True if text has nothing for clean_for_speech to do but whitespace.
+
+    Lets plain prose, the common case for a streamed sentence, skip every
+    pass.
+    """
+    if not text.isascii():  # possible emoji
+        return False
+    if not _MARKUP_CHARS.isdisjoint(text):
+        return False
+    # Without newlines, a list marker can only be at the very start
+    return not _may_start_with_list_marker(text)
+
+
+def _may_start_with_list_marker(text: str) -> bool:
+    first = text.lstrip()[:1]
+    return first == "-" or first.isdigit()
+
+
+# Texts longer than this bypass the cache: whole replies rarely repeat, and
+# would only evict the short sentences that do while pinning large strings.
+_CACHE_MAX_LEN = 1024
+
 
 def clean_for_speech(text: str) -> str:
-    """Strip emojis and collapse extra whitespace for TTS."""
-    text = _EMOJI_RE.sub("", text)
-    text = re.sub(r"  +", " ", text)  # collapse double spaces left by removal
-    return text.strip()
+    """Make LLM output suitable for TTS.
+
+    Strips emojis and markdown (headers, list markers, bold/italic), ends
+    list items with a period so they are read with a pause, and collapses
+    extra whitespace.
+    """
+    if len(text) > _CACHE_MAX_LEN:
+        return _clean(text)
+    return _clean_cached(text)
+
+
+def _clean(text: str) -> str:
+    if not _is_plain(text):
+        text = _strip_markup(text)
+    return " ".join(text.split())  # collapse gaps left by removal, and strip
+
+
+# canned phrases and repeated sentences recur a lot
+_clean_cached = lru_cache(maxsize=256)(_clean)
+
+
+# Joins texts for clean_for_speech_batch. The newline makes each text start
+# a line, so ^-anchored patterns match as they would on the text alone; the
+# record separator in front stops a period being inserted at the join.
+_BATCH_SEP = "\x1e\n"
+
+
+def clean_for_speech_batch(texts: list[str]) -> list[str]:
+    """clean_for_speech() for many texts, with one set of passes over all.
+
+    Saves the per-call overhead when cleaning many small chunks, e.g. the
+    pieces of a streamed reply.
+    """
+    if len(texts) < 2 or any(_BATCH_SEP[0] in text for text in texts):
+        return [clean_for_speech(text) for text in texts]
+    joined = _strip_markup(_BATCH_SEP.join(texts))
+    return [" ".join(part.split()) for part in joined.split(_BATCH_SEP)]
+
+
+def _strip_markup(text: str) -> str:
+    """Remove emojis and markdown, adding periods at unpunctuated line ends."""
+    if text and max(text) >= _EMOJI_MIN:
+        text = text.translate(_EMOJI_TRANSLATE)
+    # Each pass only runs if the text has a character it could match
+    if (
+        "*" in text
+        or "#" in text
+        or "\n" in text
+        or _may_start_with_list_marker(text)
+    ):
+        text = _RE_MARKDOWN.sub(_MARKDOWN_REPL, text)
+    if "\n" in text:
+        # Separate pass: line ends are only known once list markers are gone
+        text = _end_lines(text)
+    if not _STRAY_CHAR_SET.isdisjoint(text):
+        text = text.translate(_STRAY_MARKUP)
+    if not _STRAY_SYMBOL_SET.isdisjoint(text):
+        text = _RE_STRAY_SYMBOLS.sub("", text)
+    return text
+
+
+def _end_lines(text: str) -> str:
+    """Insert a period at the end of every unpunctuated line."""
+    parts = []
+    start = 0
+    while (end := text.find("\n", start)) >= 0:
+        line = text[start:end].rstrip(" \t")
+        parts.append(line)
+        if line and line[-1] not in _LINE_TERMINATORS and not line[-1].isspace():
+            parts.append(".")
+        parts.append(text[start + len(line) : end + 1])  # trailing blanks, \n
+        start = end + 1
+    parts.append(text[start:])
+    return "".join(parts)
 
 
 class TTSBackend(Protocol):
     """Interface for TTS backends."""
 
     def speak(self, text: str) -> None: ...
+    def stop(self) -> None: ...
+    def resume(self) -> None: ...
 
 
 class MacOSSayTTS:
@@ -58,14 +194,43 @@ class MacOSSayTTS:
             raise RuntimeError("macOS `say` command is only available on macOS")
         self.voice = voice
         self.rate = rate
+        self._argv = ("say", "-v", voice, "-r", str(rate))
+        self._proc: subprocess.Popen[bytes] | None = None
+        self._lock = threading.Lock()
+        self._stopped = False
 
     def speak(self, text: str) -> None:
         """Speak text through the system speaker. Blocks until done."""
         text = clean_for_speech(text)
         if not text:
             return
-        cmd = ["say", "-v", self.voice, "-r", str(self.rate), text]
-        subprocess.run(cmd, check=True)
+        with self._lock:
+            if self._stopped:
+                return
+            # `say` reads the text from stdin and only speaks once it hits EOF
+            proc = self._proc = subprocess.Popen(
+                self._argv, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL
+            )
+        # Unlike write() + close(), ignores a broken pipe if `say` has
+        # already exited, and always waits for it
+        proc.communicate(text.encode("utf-8"))
+        if proc.returncode and not self._stopped:
+            raise subprocess.CalledProcessError(proc.returncode, proc.args)
+
+    def stop(self) -> None:
+        """Cut off the text being spoken; speak() does nothing until resume().
+
+        Safe to call from any thread.
+        """
+        with self._lock:
+            self._stopped = True
+            if self._proc is not None:
+                self._proc.terminate()  # no-op once the process has exited
+
+    def resume(self) -> None:
+        """Let speak() play again after stop()."""
+        with self._lock:
+            self._stopped = False
 
 
 class PiperTTS:
@@ -78,6 +243,9 @@ class PiperTTS:
     def __init__(self, model_path: str, piper_bin: str = "piper") -> None:
         self.model_path = model_path
         self.piper_bin = piper_bin
+        self._procs: tuple[subprocess.Popen[bytes], ...] = ()
+        self._lock = threading.Lock()
+        self._stopped = False
 
     def speak(self, text: str) -> None:
         """Synthesize speech and play through speakers."""
@@ -87,25 +255,111 @@ class PiperTTS:
         # Piper outputs WAV to stdout; pipe to aplay/afplay for playback
         play_cmd = "afplay" if sys.platform == "darwin" else "aplay"
 
-        piper_proc = subprocess.Popen(
-            [self.piper_bin, "--model", self.model_path, "--output_file", "-"],
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        with self._lock:
+            if self._stopped:
+                return
+            piper_proc = subprocess.Popen(
+                [self.piper_bin, "--model", self.model_path, "--output_file", "-"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
 
-        play_proc = subprocess.Popen(
-            [play_cmd, "-"],
-            stdin=piper_proc.stdout,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+            play_proc = subprocess.Popen(
+                [play_cmd, "-"],
+                stdin=piper_proc.stdout,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+
+            self._procs = (piper_proc, play_proc)
 
         piper_proc.stdin.write(text.encode("utf-8"))
         piper_proc.stdin.close()
         play_proc.wait()
         piper_proc.wait()
 
+    def stop(self) -> None:
+        """Cut off the text being spoken; speak() does nothing until resume().
+
+        Safe to call from any thread.
+        """
+        with self._lock:
+            self._stopped = True
+            for proc in self._procs:
+                proc.terminate()  # no-op once the process has exited
+
+    def resume(self) -> None:
+        """Let speak() play again after stop()."""
+        with self._lock:
+            self._stopped = False
+
+
+class AsyncSpeaker:
+    """Run a TTS backend on a worker thread so playback overlaps other work.
+
+    Texts are spoken one at a time, in the order they were queued.
+    """
+
+    def __init__(self, tts: TTSBackend) -> None:
+        self.tts = tts
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="whispy-tts"
+        )
+        self._pending: list[Future[None]] = []
+        # Bumped by interrupt(): texts queued before it are skipped even if
+        # the worker has already taken them off the queue
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def speak(self, text: str) -> Future[None]:
+        """Queue text for playback and return immediately."""
+        future = self._executor.submit(self._speak, text, self._generation)
+        self._pending.append(future)
+        return future
+
+    def _speak(self, text: str, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                return
+            self.tts.resume()
+        self.tts.speak(text)
+
+    def interrupt(self) -> None:
+        """Cut off the text being spoken and drop the queued ones.
+
+        Errors from texts already spoken are still reported by wait().
+        """
+        with self._lock:
+            self._generation += 1
+            self.tts.stop()
+        for future in self._pending:
+            future.cancel()
+
+    def wait(self) -> None:
+        """Block until all queued speech is done, re-raising the first error."""
+        pending, self._pending = self._pending, []
+        for i, future in enumerate(pending):
+            if future.cancelled():
+                continue
+            try:
+                future.result()
+            except Exception:
+                # Drop whatever is still queued behind the failed text
+                for later in pending[i + 1 :]:
+                    later.cancel()
+                raise
+
+    def close(self) -> None:
+        """Stop speaking now and shut down the worker thread.
+
+        Queued texts are dropped and the one playing is cut off, so quitting
+        (or Ctrl+C) doesn't wait for the rest of the reply to be read out.
+        """
+        self.interrupt()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._pending.clear()
+
 
 def create_tts(backend: str, voice: str, rate: int = 180) -> TTSBackend:
     """Factory: create the appropriate TTS backend."""
@@ -0,0 +1,82 @@
+"""Tests for audio capture and WAV conversion."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+
+class CallbackStop(Exception):
+    """Stands in for sounddevice.CallbackStop."""
+
+
+@pytest.fixture
+def recorder():
+    """A Recorder on a fake sounddevice, holding 2 s at 10 Hz (20 samples)."""
+    from whispy.audio import Recorder
+
+    fake_sd = SimpleNamespace(CallbackStop=CallbackStop, InputStream=MagicMock())
+    with patch("whispy.audio._require_sounddevice", return_value=fake_sd):
+        rec = Recorder(sample_rate=10, max_seconds=2)
+    rec.start()
+    return rec
+
+
+def _block(values: list[float]) -> np.ndarray:
+    """An (frames, 1) float32 block, as PortAudio passes to the callback."""
+    return np.array(values, dtype=np.float32).reshape(-1, 1)
+
+
+def test_recorder_collects_blocks(recorder):
+    recorder._callback(_block([0.1] * 8), 8, None, None)
+    recorder._callback(_block([0.2] * 8), 8, None, None)
+
+    audio = recorder.stop()
+    assert audio.tolist() == pytest.approx([0.1] * 8 + [0.2] * 8)
+    assert not recorder.is_full
+    assert not recorder.get_diagnostics(audio, 10)["truncated"]
+
+
+def test_recorder_stops_when_buffer_is_full(recorder):
+    recorder._callback(_block([0.1] * 16), 16, None, None)
+    # Only 4 of these 8 frames fit; the rest is dropped and capture stops
+    with pytest.raises(CallbackStop):
+        recorder._callback(_block([0.5] * 8), 8, None, None)
+
+    assert recorder.is_full
+    audio = recorder.stop()
+    assert audio.size == 20
+    assert audio[-4:].tolist() == pytest.approx([0.5] * 4)
+    assert recorder.get_diagnostics(audio, 10)["truncated"]
+
+
+def test_recorder_stop_returns_a_copy(recorder):
+    recorder._callback(_block([0.1] * 4), 4, None, None)
+    audio = recorder.stop()
+
+    recorder.start()
+    recorder._callback(_block([0.9] * 4), 4, None, None)
+    assert audio.tolist() == pytest.approx([0.1] * 4)
+
+
+def test_recorder_summarises_stream_errors(recorder):
+    recorder._callback(_block([0.1] * 4), 4, None, "input overflow")
+    recorder._callback(_block([0.1] * 4), 4, None, None)
+    recorder._callback(_block([0.1] * 4), 4, None, "input underflow")
+
+    diag = recorder.get_diagnostics(recorder.stop(), 10)
+    assert diag["stream_errors"] == ["2 stream errors; last=input underflow"]
+
+
+def test_wav_round_trip_clips_out_of_range_samples():
+    from whispy.audio import audio_to_wav_bytes, wav_bytes_to_audio
+
+    audio = np.array([0.0, 0.5, -0.5, 1.0, -1.0, 1.5, -2.0], dtype=np.float32)
+    decoded, sample_rate = wav_bytes_to_audio(audio_to_wav_bytes(audio, 16000))
+
+    assert sample_rate == 16000
+    assert decoded.dtype == np.float32
+    assert decoded.shape == audio.shape  # mono stays 1-D
+    expected = np.clip(audio, -1.0, 1.0)
+    assert decoded == pytest.approx(expected, abs=1 / 32767)
@@ -1,8 +1,12 @@
 """Tests for whispy configuration."""
 
+import dataclasses
+import os
 import tempfile
 from pathlib import Path
 
+import pytest
+
 from whispy.config import WhispyConfig, load_config, parse_args
 
 
@@ -37,6 +41,19 @@ def test_resolved_tts_voice_custom_override():
     assert config.resolved_tts_voice == "Daniel"
 
 
+def test_config_is_frozen_and_hashable():
+    config = WhispyConfig()
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        config.language = "fr"
+    assert hash(config) == hash(WhispyConfig())
+
+
+def test_replace_recomputes_derived_fields():
+    config = dataclasses.replace(WhispyConfig(language="en"), language="fr")
+    assert config.resolved_tts_voice == "Thomas"
+    assert "français" in config.system_prompt
+
+
 def test_load_config_from_toml():
     toml_content = b"""
 [whispy]
@@ -59,6 +76,18 @@ tts_rate = 160
     assert config.sample_rate == 16000
 
 
+def test_load_config_is_cached_until_file_changes():
+    with tempfile.NamedTemporaryFile(suffix=".toml", delete=False) as f:
+        f.write(b'[whispy]\nlanguage = "fr"\n')
+    path = Path(f.name)
+    assert load_config(path) is load_config(path)
+
+    path.write_bytes(b'[whispy]\nlanguage = "en"\n')
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config(path).language == "en"
+
+
 def test_load_config_missing_file():
     config = load_config(Path("/nonexistent/config.toml"))
     # Should return defaults when file doesn't exist
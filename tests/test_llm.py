@@ -27,10 +27,10 @@ def test_chat_sends_message(mock_ollama):
     assert reply == "Four!"
     mock_ollama.chat.assert_called_once()
     # After chat: system + user + assistant = 3
-    assert len(llm._history) == 3
-    assert llm._history[0]["role"] == "system"
-    assert llm._history[1] == {"role": "user", "content": "What is 2+2?"}
-    assert llm._history[2] == {"role": "assistant", "content": "Four!"}
+    assert len(llm.history) == 3
+    assert llm.history[0]["role"] == "system"
+    assert llm.history[1] == {"role": "user", "content": "What is 2+2?"}
+    assert llm.history[2] == {"role": "assistant", "content": "Four!"}
 
 
 def test_chat_maintains_history(mock_ollama):
@@ -43,9 +43,9 @@ def test_chat_maintains_history(mock_ollama):
     llm.chat("Second question")
 
     # system + user1 + assistant1 + user2 + assistant2 = 5
-    assert len(llm._history) == 5
-    assert llm._history[3] == {"role": "user", "content": "Second question"}
-    assert llm._history[4] == {"role": "assistant", "content": "Second answer"}
+    assert len(llm.history) == 5
+    assert llm.history[3] == {"role": "user", "content": "Second question"}
+    assert llm.history[4] == {"role": "assistant", "content": "Second answer"}
 
 
 def test_reset_clears_history(mock_ollama):
@@ -56,14 +56,14 @@ def test_reset_clears_history(mock_ollama):
     llm.reset()
 
     # After reset: only system prompt remains
-    assert len(llm._history) == 1
-    assert llm._history[0]["role"] == "system"
+    assert len(llm.history) == 1
+    assert llm.history[0]["role"] == "system"
 
     mock_ollama.chat.return_value = _make_ollama_response("Fresh answer")
     llm.chat("New question")
 
     # system + user + assistant = 3
-    assert len(llm._history) == 3
+    assert len(llm.history) == 3
 
 
 def test_history_trimming(mock_ollama):
@@ -76,12 +76,12 @@ def test_history_trimming(mock_ollama):
         llm.chat(f"Question {i}")
 
     # History should be trimmed to max_history
-    assert len(llm._history) <= 6
+    assert len(llm.history) <= 6
     # System prompt is always preserved
-    assert llm._history[0]["role"] == "system"
-    assert llm._history[0]["content"] == "System."
+    assert llm.history[0]["role"] == "system"
+    assert llm.history[0]["content"] == "System."
     # Most recent exchange is kept
-    assert llm._history[-1]["content"] == "Answer 9"
+    assert llm.history[-1]["content"] == "Answer 9"
 
 
 def test_chat_without_system_prompt(mock_ollama):
@@ -92,6 +92,66 @@ def test_chat_without_system_prompt(mock_ollama):
 
     assert reply == "Four!"
     # user + assistant = 2 (no system prompt)
-    assert len(llm._history) == 2
-    assert llm._history[0]["role"] == "user"
-    assert llm._history[1]["role"] == "assistant"
+    assert len(llm.history) == 2
+    assert llm.history[0]["role"] == "user"
+    assert llm.history[1]["role"] == "assistant"
+
+
+def test_chat_stream_yields_chunks(mock_ollama):
+    from whispy.llm import OllamaLLM
+
+    mock_ollama.chat.return_value = iter(
+        [_make_ollama_response("Two plus "), _make_ollama_response("two is four.")]
+    )
+    llm = OllamaLLM(model="test-model", system_prompt="Be helpful.")
+    chunks = list(llm.chat_stream("What is 2+2?"))
+
+    assert chunks == ["Two plus ", "two is four."]
+    assert mock_ollama.chat.call_args.kwargs["stream"] is True
+    # Full reply is kept in history once the stream is done
+    assert llm.history[-1] == {"role": "assistant", "content": "Two plus two is four."}
+
+
+def test_chat_stream_failure_drops_user_message(mock_ollama):
+    from whispy.llm import OllamaLLM
+
+    mock_ollama.chat.side_effect = Exception("Connection refused")
+    llm = OllamaLLM(model="test-model", system_prompt="Be helpful.")
+
+    with pytest.raises(RuntimeError, match="Cannot connect to Ollama"):
+        list(llm.chat_stream("Hello"))
+    assert len(llm.history) == 1
+
+
+def test_iter_sentences_regroups_chunks():
+    from whispy.llm import iter_sentences
+
+    chunks = ["Hello the", "re! How are", " you? Here:\n1", ". Apples\n- Pe", "ars"]
+    assert list(iter_sentences(chunks)) == [
+        "Hello there!",
+        "How are you?",
+        "Here:",
+        "1. Apples",
+        "- Pears",
+    ]
+
+
+def test_iter_sentences_keeps_abbreviations():
+    from whispy.llm import iter_sentences
+
+    chunks = ["Use a tool, e.", "g. this works. Ask Dr. Smith", " (i.e. me).\nOk"]
+    assert list(iter_sentences(chunks)) == [
+        "Use a tool, e.g. this works.",
+        "Ask Dr. Smith (i.e. me).",
+        "Ok",
+    ]
+
+
+def test_model_is_warmed_up_in_background(mock_ollama):
+    from whispy.llm import OllamaLLM
+
+    llm = OllamaLLM(model="test-model", keep_alive="10m")
+    llm.chat("Hello")
+
+    mock_ollama.generate.assert_called_once_with(model="test-model", keep_alive="10m")
+    assert mock_ollama.chat.call_args.kwargs["keep_alive"] == "10m"
@@ -0,0 +1,96 @@
+"""Tests for speech-to-text."""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from whispy.stt import (
+    STT,
+    WHISPER_SAMPLE_RATE,
+    _cpu_model_for,
+    _has_accelerator,
+    _pack_windows,
+)
+
+
+class Segment(NamedTuple):
+    """pywhispercpp's segment: times in 10 ms units."""
+
+    t0: int
+    t1: int
+    text: str
+
+
+def test_has_accelerator_old_style_flags():
+    assert _has_accelerator("AVX = 1 | METAL = 1 | CUDA = 0 | COREML = 0 | ")
+    assert not _has_accelerator("AVX = 1 | METAL = 0 | BLAS = 1 | CUDA = 0 | ")
+
+
+def test_has_accelerator_backend_sections():
+    assert _has_accelerator("WHISPER : COREML = 0 | Metal : EMBED_LIBRARY = 1 | CPU : NEON = 1 | ")
+    assert not _has_accelerator("WHISPER : COREML = 0 | OPENVINO = 0 | CPU : AVX2 = 1 | ")
+
+
+def test_cpu_model_for():
+    assert _cpu_model_for("small") == "base"
+    assert _cpu_model_for("medium.en") == "base.en"
+    assert _cpu_model_for("large-v3-q5_0") == "base"
+    # Already fast enough on a CPU
+    assert _cpu_model_for("tiny") == "tiny"
+    assert _cpu_model_for("base.en") == "base.en"
+
+
+class FakeWhisper:
+    """Stands in for pywhispercpp's Model, replying with canned segments."""
+
+    def __init__(self, segments: list[Segment]) -> None:
+        self.segments = segments
+        self.calls: list[tuple[int, dict]] = []
+
+    def transcribe(self, audio: np.ndarray, **params) -> list[Segment]:
+        self.calls.append((audio.size, params))
+        return self.segments
+
+
+def _stt(model: FakeWhisper) -> STT:
+    stt = STT.__new__(STT)  # skip loading whisper.cpp
+    stt.model_name = "tiny"
+    stt.model = model
+    return stt
+
+
+def test_pack_windows_first_fit_decreasing():
+    assert _pack_windows({0: 10, 1: 25, 2: 40}, capacity=50, gap=5) == [[2], [1, 0]]
+
+
+def test_pack_windows_oversize_clip_gets_own_window():
+    assert _pack_windows({0: 80, 1: 10, 2: 10}, capacity=50, gap=5) == [[0], [1, 2]]
+
+
+def test_transcribe_batch_packs_clips_and_skips_empty():
+    # Two 1 s clips packed with a 1 s gap: 0-100, gap, 200-300 (10 ms units)
+    model = FakeWhisper([Segment(0, 40, " Hello"), Segment(210, 260, " Bye")])
+    clip = np.ones(WHISPER_SAMPLE_RATE, dtype=np.float32)
+    texts = _stt(model).transcribe_batch([clip, np.zeros(0), clip])
+
+    assert texts == ["Hello", "", "Bye"]
+    assert len(model.calls) == 1
+    size, params = model.calls[0]
+    assert size == 3 * WHISPER_SAMPLE_RATE
+    assert params["max_len"] == 1 and params["split_on_word"]
+
+
+def test_transcribe_batch_splits_segment_spanning_clips():
+    model = FakeWhisper([Segment(50, 250, " hello there general kenobi")])
+    clip = np.ones(WHISPER_SAMPLE_RATE, dtype=np.float32)
+    assert _stt(model).transcribe_batch([clip, clip]) == [
+        "hello there",
+        "general kenobi",
+    ]
+
+
+def test_transcribe_batch_single_clip_uses_default_segments():
+    model = FakeWhisper([Segment(0, 100, " Just one")])
+    long_clip = np.ones(40 * WHISPER_SAMPLE_RATE, dtype=np.float32)
+    assert _stt(model).transcribe_batch([long_clip]) == ["Just one"]
+    assert model.calls[0][1]["max_len"] == 0
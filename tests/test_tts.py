@@ -0,0 +1,235 @@
+"""Tests for the TTS module."""
+
+import subprocess
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from whispy.tts import (
+    _MARKDOWN_REPL,
+    _RE_MARKDOWN,
+    AsyncSpeaker,
+    MacOSSayTTS,
+    _clean_cached,
+    clean_for_speech,
+    clean_for_speech_batch,
+)
+
+
+@pytest.fixture(autouse=True)
+def _clear_clean_cache():
+    """Each test sees a cold clean_for_speech cache."""
+    _clean_cached.cache_clear()
+    yield
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        # emojis
+        ("Hello! 😊🌟", "Hello!"),
+        ("I love the sun ☀️ and stars ✨ too", "I love the sun and stars too"),
+        ("Great job ⭐ keep going 🟢", "Great job keep going"),
+        # normal text is preserved
+        ("Hello, how are you today?", "Hello, how are you today?"),
+        ("Ça va très bien, merci !", "Ça va très bien, merci !"),
+        # empty and whitespace
+        ("", ""),
+        ("   ", ""),
+        ("  hello  ", "hello"),
+        # markdown
+        ("This is **important** stuff", "This is important stuff"),
+        ("This is *really* cool", "This is really cool"),
+        ("## Fun facts\nCats sleep a lot.", "Fun facts. Cats sleep a lot."),
+        ("Type `print` to ~~shout~~ talk", "Type print to shout talk"),
+        ("| Fruit | Colour |", "Fruit Colour"),
+        ("Unclosed **bold and *italic", "Unclosed bold and italic"),
+        ("Nested **bold *and* italic** text", "Nested bold and italic text"),
+        ("**bold**text", "boldtext"),
+        ("un**frigging**believable", "unfriggingbelievable"),
+        # list items get periods, without doubling existing punctuation
+        (
+            "Here are the steps:\n1. Add the numbers\n2. Check your answer",
+            "Here are the steps: Add the numbers. Check your answer",
+        ),
+        (
+            "1. First item.\n2. Second item!\n3. Third item:\n4. Last",
+            "First item. Second item! Third item: Last",
+        ),
+        ("Trailing blanks \t\nNext line", "Trailing blanks. Next line"),
+        # symbols that aren't markup are kept
+        ("What is 7*8?", "What is 7*8?"),
+        ("3 * 4 = 12", "3 * 4 = 12"),
+        ("2*3=6 and 4*5=20", "2*3=6 and 4*5=20"),
+        ("(2+3)*4 is 20", "(2+3)*4 is 20"),
+        ("Name it snake_case", "Name it snake_case"),
+        ("I like C# and F#, we're #1", "I like C# and F#, we're #1"),
+        ("__Init__ is _special_ ##", "Init is special"),
+        # a sentence starting with a year is not a numbered list item
+        ("2024. That year was fun", "2024. That year was fun"),
+    ],
+)
+def test_clean_for_speech(text, expected):
+    assert clean_for_speech(text) == expected
+
+
+@pytest.mark.parametrize(
+    "text, must_contain, must_not_contain",
+    [
+        ("You need:\n- Flour\n* Sugar\n- Eggs", ["Flour.", "Sugar."], ["-", "*"]),
+        ("1. One\n2. Two.\n3. Three!", ["One.", "Two.", "Three!"], [".."]),
+    ],
+)
+def test_clean_for_speech_contains(text, must_contain, must_not_contain):
+    result = clean_for_speech(text)
+    for fragment in must_contain:
+        assert fragment in result
+    for fragment in must_not_contain:
+        assert fragment not in result
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["2*3=6 and 4*5=20", "3 * 4 = 12", "2**3 and 4**5", "a * b * c", "x*y*z"],
+)
+def test_arithmetic_is_not_emphasis(text):
+    assert _RE_MARKDOWN.sub(_MARKDOWN_REPL, text) == text
+
+
+@pytest.mark.parametrize(
+    "texts",
+    [
+        [],
+        [""],
+        ["Hello! 😊", "- Flour\n- Sugar", "1. One\n2. Two", "**Bold** move"],
+        ["Ends with a line\n", "# Title", "  spaced  out  ", "*a*", "Line\nbreak"],
+        ["Has a \x1e separator", "- item"],
+    ],
+)
+def test_batch_equivalence(texts):
+    assert clean_for_speech_batch(texts) == [clean_for_speech(t) for t in texts]
+
+
+def test_long_text_bypasses_cache():
+    text = "**Word** " * 200
+    assert clean_for_speech(text) == " ".join(["Word"] * 200)
+    assert _clean_cached.cache_info().currsize == 0
+
+
+class FakeTTS:
+    """Records what it speaks. speak() blocks on texts in `hold` until stop()."""
+
+    def __init__(self, fail_on: str = "", hold: tuple[str, ...] = ()) -> None:
+        self.spoken: list[str] = []
+        self.fail_on = fail_on
+        self.hold = hold
+        self.started = threading.Event()
+        self.stopped = threading.Event()
+
+    def speak(self, text: str) -> None:
+        self.started.set()
+        if text in self.hold:
+            self.stopped.wait(timeout=5)
+        if text == self.fail_on:
+            raise RuntimeError(f"cannot say {text!r}")
+        self.spoken.append(text)
+
+    def stop(self) -> None:
+        self.stopped.set()
+
+    def resume(self) -> None:
+        self.stopped.clear()
+
+
+def test_async_speaker_speaks_in_order():
+    tts = FakeTTS()
+    speaker = AsyncSpeaker(tts)
+    for text in ["one", "two", "three"]:
+        speaker.speak(text)
+    speaker.wait()
+    speaker.close()
+    assert tts.spoken == ["one", "two", "three"]
+
+
+def test_async_speaker_wait_reraises_error():
+    tts = FakeTTS(fail_on="two")
+    speaker = AsyncSpeaker(tts)
+    for text in ["one", "two"]:
+        speaker.speak(text)
+    with pytest.raises(RuntimeError, match="cannot say 'two'"):
+        speaker.wait()
+    speaker.wait()  # the failure is reported once
+    speaker.close()
+
+
+def test_async_speaker_wait_cancels_after_failure():
+    speaker = AsyncSpeaker(FakeTTS())
+    failed: Future[None] = Future()
+    failed.set_exception(RuntimeError("boom"))
+    queued: Future[None] = Future()
+    speaker._pending = [failed, queued]
+    with pytest.raises(RuntimeError, match="boom"):
+        speaker.wait()
+    assert queued.cancelled()
+    speaker.close()
+
+
+def test_async_speaker_close_drops_queued_speech():
+    tts = FakeTTS(hold=("one",))
+    speaker = AsyncSpeaker(tts)
+    futures = [speaker.speak(text) for text in ["one", "two", "three"]]
+    assert tts.started.wait(timeout=5)
+    speaker.close()  # must not wait for "one" to finish on its own
+    assert tts.stopped.is_set()
+    assert tts.spoken == ["one"]
+    assert all(future.cancelled() for future in futures[1:])
+
+
+def test_async_speaker_interrupt_then_speak_again():
+    tts = FakeTTS(hold=("one",))
+    speaker = AsyncSpeaker(tts)
+    futures = [speaker.speak(text) for text in ["one", "two"]]
+    assert tts.started.wait(timeout=5)
+    speaker.interrupt()
+    assert futures[1].cancelled()
+    speaker.speak("three")
+    speaker.wait()
+    speaker.close()
+    assert tts.spoken == ["one", "three"]
+
+
+def test_async_speaker_interrupt_skips_text_already_taken():
+    tts = FakeTTS()
+    speaker = AsyncSpeaker(tts)
+    # The worker has dequeued a text queued before an interrupt, but has
+    # not started speaking it yet
+    speaker._generation += 1
+    speaker._speak("stale", generation=0)
+    speaker.close()
+    assert tts.spoken == []
+
+
+def _say_tts(*argv: str) -> MacOSSayTTS:
+    """A MacOSSayTTS running argv instead of `say`, on any platform."""
+    tts = MacOSSayTTS.__new__(MacOSSayTTS)
+    tts._argv = argv
+    tts._proc = None
+    tts._lock = threading.Lock()
+    tts._stopped = False
+    return tts
+
+
+def test_say_failure_raises_called_process_error():
+    tts = _say_tts("sh", "-c", "exit 3")
+    with pytest.raises(subprocess.CalledProcessError) as excinfo:
+        tts.speak("x" * 1_000_000)  # more than a pipe buffer
+    assert excinfo.value.returncode == 3
+    assert tts._proc.returncode == 3  # reaped
+
+
+def test_say_does_not_start_after_stop():
+    tts = _say_tts("sh", "-c", "exit 3")
+    tts.stop()
+    tts.speak("Hello")
+    assert tts._proc is None